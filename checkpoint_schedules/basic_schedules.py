@@ -31,6 +31,8 @@ class SingleMemoryStorageSchedule(CheckpointSchedule):
     Online, unlimited adjoint calculations permitted.
     """
 
+    __slots__ = ("_storage",)
+
     def __init__(self):
         super().__init__()
         self._storage = StorageType.WORK
@@ -108,6 +110,8 @@ class SingleDiskStorageSchedule(CheckpointSchedule):
     one adjoint calculation permitted if `move_data` is `True`.
     """
 
+    __slots__ = ("_move_data", "_storage")
+
     def __init__(self, move_data=False):
         super().__init__()
         self._move_data = move_data
@@ -117,6 +121,9 @@ class SingleDiskStorageSchedule(CheckpointSchedule):
         """Schedule iterator.
         """
 
+        work = StorageType.WORK
+        disk = StorageType.DISK
+
         if self._max_n is not None:
             # Unexpected finalize
             raise RuntimeError("Invalid checkpointing state")
@@ -125,7 +132,7 @@ class SingleDiskStorageSchedule(CheckpointSchedule):
             n0 = self._n
             n1 = n0 + 1
             self._n = n1
-            yield Forward(n0, n1, False, True, StorageType.DISK)
+            yield Forward(n0, n1, False, True, disk)
 
         yield EndForward()
 
@@ -136,9 +143,9 @@ class SingleDiskStorageSchedule(CheckpointSchedule):
 
                 self._n = n0
                 if self._move_data:
-                    yield Move(self._n, StorageType.DISK, StorageType.WORK)
+                    yield Move(self._n, disk, work)
                 else:
-                    yield Copy(self._n, StorageType.DISK, StorageType.WORK)
+                    yield Copy(self._n, disk, work)
 
                 self._r = self._max_n - n0
                 yield Reverse(n1, n0, True)
@@ -186,6 +193,8 @@ class NoneCheckpointSchedule(CheckpointSchedule):
     Online, zero adjoint calculations permitted.
     """
 
+    __slots__ = ("_exhausted",)
+
     def __init__(self):
         super().__init__()
         self._exhausted = False
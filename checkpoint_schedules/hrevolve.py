@@ -9,8 +9,14 @@
 Disk Revolve, Periodic Disk Revolve and Revolve algorithms.
 """
 
+from collections import namedtuple
+import functools
+import numpy as np
+import operator
 from .schedule import CheckpointSchedule, Forward, Reverse, Copy, Move, \
-    EndForward, EndReverse, StorageType
+    EndForward, EndReverse, StorageType, InvalidForwardStep, \
+    InvalidReverseStep, InvalidRevolverAction, InvalidActionIndex, \
+    _STORAGE_TYPE
 from .hrevolve_sequences import hrevolve, disk_revolve, \
     periodic_disk_revolve, revolve
 
@@ -20,21 +26,84 @@ __all__ = \
         "Revolve"
     ]
 
+# Storage levels used by the H-Revolve sequences, indexed by level: 0 for RAM
+# and 1 for disk.
+_STORAGE_LEVELS = (StorageType.RAM, StorageType.DISK)
+
+# Operation identifiers. Operations which are handled identically when
+# converting to checkpoint_schedules actions share an identifier.
+_FORWARD = 0
+_BACKWARD = 1
+_READ = 2
+_WRITE = 3
+_WRITE_FORWARD = 4
+_WRITE_FORWARD_MEMORY = 5
+_DISCARD = 6
+_DISCARD_FORWARD = 7
+_DISCARD_FORWARD_MEMORY = 8
+
+# Storage identifiers used when converting H-Revolve sequences. These are the
+# StorageType values, with operations which do not reference a storage type
+# using the StorageType.NONE value.
+_NO_STORAGE = StorageType.NONE.value
+_STORAGE_ID = {None: _NO_STORAGE,
+               StorageType.WORK: StorageType.WORK.value,
+               StorageType.RAM: StorageType.RAM.value,
+               StorageType.DISK: StorageType.DISK.value}
+
+_ACTION_ID = {
+    "Forward": _FORWARD,
+    "Backward": _BACKWARD,
+    "Read": _READ,
+    "Read_memory": _READ,
+    "Read_disk": _READ,
+    "Write": _WRITE,
+    "Write_memory": _WRITE,
+    "Write_disk": _WRITE,
+    "Write_Forward": _WRITE_FORWARD,
+    "Write_Forward_memory": _WRITE_FORWARD_MEMORY,
+    "Discard": _DISCARD,
+    "Discard_memory": _DISCARD,
+    "Discard_Forward": _DISCARD_FORWARD,
+    "Discard_Forward_memory": _DISCARD_FORWARD_MEMORY,
+}
+
+# A sequence of operations converted by _build_soa
+_OperationArrays = namedtuple("_OperationArrays",
+                              ["action_ids", "n0s", "n1s", "storages"])
+
 
 class RevolveCheckpointSchedule(CheckpointSchedule):
     """A checkpointing schedule.
     Offline, one adjoint calculation permitted.
 
+    Parameters
+    ----------
+    max_n : int
+        The number of forward steps in the initial forward calculation.
+    snapshots_in_ram : int
+        The maximum steps to store the forward checkpoints in memory.
+    snapshots_on_disk : int
+        The maximum steps to store the forward checkpoints on disk.
+    schedule : iterable
+        The sequence of operations given by a revolver algorithm, e.g.
+        :func:`hrevolve_sequences.revolve`.
+
     Attributes
     ----------
     _snapshots_in_ram : int
         The maximum steps to store the forward checkpoints in memory.
     _snapshots_on_disk : int
         The maximum steps to store the forward checkpoints on disk.
-    _schedule : list
-        A sequence of operations given by a revolver algorithm.
     _exhausted : bool
         A flag indicating whether the schedule is exhausted.
+    _action_ids, _n0s, _n1s, _storages : ndarray
+        The operation identifiers, step indices and storage identifiers of
+        the sequence of operations given by a revolver algorithm. See
+        :func:`_build_soa`.
+    _actions : tuple or None
+        The converted actions, or `None` if the operations have not yet been
+        converted.
 
     Notes
     -----
@@ -47,6 +116,9 @@ class RevolveCheckpointSchedule(CheckpointSchedule):
     schedules for `'_snapshots_in_ram > 0'`.**
     """
 
+    __slots__ = ("_exhausted", "_snapshots_in_ram", "_snapshots_on_disk",
+                 "_action_ids", "_n0s", "_n1s", "_storages", "_actions")
+
     def __init__(self, max_n, snapshots_in_ram, snapshots_on_disk, schedule):
         super().__init__(max_n)
         assert snapshots_in_ram > 0
@@ -54,7 +126,21 @@ class RevolveCheckpointSchedule(CheckpointSchedule):
         self._exhausted = False
         self._snapshots_on_disk = snapshots_on_disk
         self._snapshots_in_ram = snapshots_in_ram
-        self._schedule = schedule
+        if not isinstance(schedule, _OperationArrays):
+            # Derived classes supply cached, already converted, sequences
+            schedule = _build_soa(schedule)
+        (self._action_ids, self._n0s, self._n1s,
+         self._storages) = schedule
+        self._actions = None
+
+    def __len__(self):
+        """The total number of actions in the schedule, including the final
+        :class:`~.schedule.EndReverse` action. This does not depend on how
+        many actions have already been iterated over, and converts the
+        operations to actions if they have not yet been converted.
+        """
+
+        return len(self._cp_actions()) + 1
 
     def _iterator(self):
         """A checkpoint schedule iterator.
@@ -67,90 +153,127 @@ class RevolveCheckpointSchedule(CheckpointSchedule):
         if self._max_n is None:
             raise RuntimeError("Invalid forward steps number.")
 
-        snapshots = set()
-        w_storage = None
-        write_ics = False
-        adj_deps = False
+        for cp_action, self._n, self._r in self._cp_actions():
+            yield cp_action
+        self._exhausted = True
+        yield EndReverse()
+
+    def _cp_actions(self):
+        """Convert the revolver operations to *checkpoint_schedules* actions.
+        The conversion is performed once, and the result cached.
 
-        i = 0
-        while i < len(self._schedule):
-            cp_action, (n_0, n_1, storage) = _convert_action(self._schedule[i])
-            if cp_action == "Forward":
-                if n_0 != self._n:
+        Returns
+        -------
+        tuple[tuple[CheckpointAction, int, int]]
+            The actions preceding the final :class:`~.schedule.EndReverse`
+            action, each with the location of the forward and the number of
+            adjoint steps advanced after the action.
+        """
+
+        if self._actions is not None:
+            return self._actions
+
+        if self._snapshots_on_disk is None:
+            max_snapshots = None
+        else:
+            max_snapshots = self._snapshots_in_ram + self._snapshots_on_disk
+        # Elements are accessed as Python integers, avoiding NumPy scalars
+        action_ids, n0s, n1s, storages, discarded = (
+            values.tolist()
+            for values in (self._action_ids, self._n0s, self._n1s,
+                           self._storages,
+                           _discarded(self._action_ids, self._n0s,
+                                      self._storages)))
+
+        max_n = self._max_n
+        n = self._n
+        r = self._r
+        storage_type = _STORAGE_TYPE
+        work = StorageType.WORK
+        snapshots = bytearray(max_n + 1)
+        n_snapshots = 0
+        w_n0 = -1
+        actions = []
+        if len(action_ids) > 0:
+            # The operation preceding the first operation, with the same
+            # wrap-around as indexing with i - 1
+            p_action_id, p_n0, p_storage = \
+                action_ids[-1], n0s[-1], storages[-1]
+        for action_id, n_0, n_1, storage, discard in \
+                zip(action_ids, n0s, n1s, storages, discarded):
+            if action_id == _FORWARD:
+                if n_0 != n:
                     raise InvalidForwardStep
-                self._n = n_1
-                w_cp_action, (w_n0, _, w_storage) = _convert_action(self._schedule[i - 1])  # noqa: E501
-                if (w_cp_action == "Write" or w_cp_action == "Write_disk" or w_cp_action == "Write_memory"):  # noqa: E501
-                    if w_n0 != n_0:
-                        raise InvalidActionIndex
+                n = n_1
+                w_n0 = p_n0
+                if p_action_id == _WRITE:
                     write_ics = True
                     adj_deps = False
-                    snapshots.add(w_n0)
-                elif (w_cp_action == "Write_Forward"
-                      or w_cp_action == "Write_Forward_memory"):
-                    if w_n0 != n_1:
-                        raise InvalidActionIndex
+                    w_storage = storage_type[p_storage]
+                    if not snapshots[w_n0]:
+                        snapshots[w_n0] = True
+                        n_snapshots += 1
+                        if max_snapshots is not None \
+                                and n_snapshots > max_snapshots:
+                            raise RuntimeError("Unexpected snapshot number.")
+                elif (p_action_id == _WRITE_FORWARD
+                      or p_action_id == _WRITE_FORWARD_MEMORY):
                     write_ics = False
                     adj_deps = True
+                    w_storage = storage_type[p_storage]
                 else:
                     write_ics = False
                     adj_deps = False
-                    w_storage = StorageType.WORK
-                yield Forward(n_0, n_1, write_ics, adj_deps, w_storage)
-                if self._n == self._max_n:
-                    if self._r != 0:
+                    w_storage = work
+                actions.append((Forward(n_0, n_1, write_ics, adj_deps,
+                                        w_storage), n, r))
+                if n == max_n:
+                    if r != 0:
                         raise InvalidReverseStep
-                    yield EndForward()
-            elif cp_action == "Backward":
-                if n_0 != self._n:
+                    actions.append((EndForward(), n, r))
+            elif action_id == _BACKWARD:
+                if n_0 != n:
                     raise InvalidActionIndex
-                if n_0 != self._max_n - self._r:
+                if n_0 != max_n - r:
                     raise InvalidForwardStep
-                self._r += 1
-                yield Reverse(n_0, n_1, clear_adj_deps=True)
-            elif (cp_action == "Read"
-                  or cp_action == "Read_memory"
-                  or cp_action == "Read_disk"):
-                self._n = n_0
-                if n_0 == self._max_n - self._r - 1:
-                    snapshots.remove(n_0)
-                    yield Move(n_0, storage, StorageType.WORK)
+                r += 1
+                actions.append((Reverse(n_0, n_1, clear_adj_deps=True), n,
+                                r))
+            elif action_id == _READ:
+                # Loading of checkpoint data, deleting it (Move) if it is not
+                # needed again
+                n = n_0
+                if n_0 == max_n - r - 1:
+                    if not snapshots[n_0]:
+                        raise RuntimeError("Unexpected snapshot number.")
+                    snapshots[n_0] = False
+                    n_snapshots -= 1
+                    cp_action = Move(n_0, storage_type[storage], work)
                 else:
-                    yield Copy(n_0, storage, StorageType.WORK)
-            elif (cp_action == "Write" or cp_action == "Write_disk"
-                  or cp_action == "Write_memory"):
-                if n_0 != self._n:
+                    cp_action = Copy(n_0, storage_type[storage], work)
+                actions.append((cp_action, n, r))
+            elif action_id == _WRITE:
+                if n_0 != n:
                     raise InvalidActionIndex
-            elif cp_action == "Write_Forward":
-                if n_0 != self._n + 1:
+            elif (action_id == _WRITE_FORWARD
+                  or action_id == _WRITE_FORWARD_MEMORY):
+                if n_0 != n + 1:
                     raise InvalidActionIndex
-                d_cp_action, (d_n0, _, w_storage) = _convert_action(
-                                                    self._schedule[i + 3])
-                if (d_cp_action != "Discard_Forward" or d_n0 != n_0 or w_storage != storage):  # noqa: E501
-                    if w_n0 != n_0:
-                        raise InvalidActionIndex
-                    write_ics = True
-                    adj_deps = False
-            elif cp_action == "Write_Forward_memory":
-                if n_0 != self._n + 1:
+                if not discard and w_n0 != n_0:
                     raise InvalidActionIndex
-                d_cp_action, (d_n0, _, w_storage) = _convert_action(self._schedule[i + 3])  # noqa: E501
-                if (d_cp_action != "Discard_Forward_memory" or d_n0 != n_0 or w_storage != storage):  # noqa: E501
-                    if w_n0 != n_0:
-                        raise InvalidActionIndex
-            elif cp_action == "Discard" or cp_action == "Discard_memory":
-                if i < 2:
-                    raise InvalidRevolverAction
-            elif cp_action == "Discard_Forward" or cp_action == "Discard_Forward_memory":  # noqa: E501
-                if n_0 != self._n:
+            elif action_id == _DISCARD:
+                pass
+            elif (action_id == _DISCARD_FORWARD
+                  or action_id == _DISCARD_FORWARD_MEMORY):
+                if n_0 != n:
                     raise InvalidActionIndex
             else:
                 raise InvalidRevolverAction
-            i += 1
-        if len(snapshots) > 0:
+            p_action_id, p_n0, p_storage = action_id, n_0, storage
+        if n_snapshots > 0:
             raise RuntimeError("Unexpected snapshot number.")
-        self._exhausted = True
-        yield EndReverse()
+        self._actions = tuple(actions)
+        return self._actions
 
     @property
     def is_exhausted(self):
@@ -225,12 +348,15 @@ class HRevolve(RevolveCheckpointSchedule):
     1-25. DOI: 10.1145/3378672.
 
     """
+
+    __slots__ = ()
+
     def __init__(self, max_n, snapshots_in_ram, snapshots_on_disk,
                  uf=1, ub=1, wd=2, rd=2):
         cvec = (snapshots_in_ram, snapshots_on_disk)
-        wc = [0, wd]
-        rc = [0, rd]
-        schedule = list(hrevolve(max_n - 1, cvec, wc, rc, uf, ub))
+        wc = (0, wd)
+        rc = (0, rd)
+        schedule = _sequence(hrevolve, max_n - 1, cvec, wc, rc, uf, ub)
         super().__init__(max_n, snapshots_in_ram, snapshots_on_disk, schedule)
 
 
@@ -262,9 +388,11 @@ class DiskRevolve(RevolveCheckpointSchedule):
     DOI: 10.1145/347837.347846.
     """
 
+    __slots__ = ()
+
     def __init__(self, max_n, snapshots_in_ram, uf=1, ub=1, wd=2, rd=2):
-        schedule = list(disk_revolve(max_n - 1, snapshots_in_ram, wd, rd, uf,
-                                     ub))
+        schedule = _sequence(disk_revolve, max_n - 1, snapshots_in_ram, wd, rd,
+                             uf, ub)
         super().__init__(max_n, snapshots_in_ram, None, schedule)
 
 
@@ -297,9 +425,11 @@ class PeriodicDiskRevolve(RevolveCheckpointSchedule):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, max_n, snapshots_in_ram, uf=1, ub=1, wd=2, rd=2):
-        schedule = list(periodic_disk_revolve(max_n - 1, snapshots_in_ram, wd,
-                                              rd, uf, ub))
+        schedule = _sequence(periodic_disk_revolve, max_n - 1,
+                             snapshots_in_ram, wd, rd, uf, ub)
         super().__init__(max_n, snapshots_in_ram, None, schedule)
 
 
@@ -331,11 +461,42 @@ class Revolve(RevolveCheckpointSchedule):
     (TOMS), 26(1), 19-45., doi: 10.1145/347837.347846
     """
 
+    __slots__ = ()
+
     def __init__(self, max_n, snapshots_in_ram, uf=1, ub=1, wd=2, rd=2):
-        schedule = list(revolve(max_n - 1, snapshots_in_ram, wd, rd, uf, ub))
+        schedule = _sequence(revolve, max_n - 1, snapshots_in_ram, wd, rd, uf,
+                             ub)
         super().__init__(max_n, snapshots_in_ram, 0, schedule)
 
 
+@functools.lru_cache(maxsize=32)
+def _sequence(revolver, *args):
+    """Return the sequence of operations given by a revolver algorithm.
+
+    Parameters
+    ----------
+    revolver : callable
+        The revolver algorithm, e.g. :func:`hrevolve_sequences.revolve`.
+    args : tuple
+        Arguments passed to the revolver algorithm.
+
+    Notes
+    -----
+    The result is cached, so that schedules constructed with the same
+    parameters share a single sequence. The returned arrays are read-only.
+
+    Returns
+    -------
+    _OperationArrays
+        The sequence of operations, converted using :func:`_build_soa`.
+    """
+
+    schedule = _build_soa(revolver(*args))
+    for values in schedule:
+        values.setflags(write=False)
+    return schedule
+
+
 def _convert_action(action):
     """Convert an operation to a `checkpoint_schedules` action.
 
@@ -368,55 +529,157 @@ def _convert_action(action):
 
     """
     cp_action = action.type
-    if cp_action == "Forward":
+    if cp_action in ["Forward", "Backward"]:
         n_0, n_1 = action.index
-        if n_1 <= n_0:
-            raise RuntimeError("Invalid forward indexes.")
-        storage = None
-    elif cp_action == "Backward":
-        n_0, n_1 = action.index
-        if n_0 <= n_1:
-            raise RuntimeError("Invalid backward indexes.")
         storage = None
     elif cp_action in ["Read", "Write", "Discard"]:
         storage, n_0 = action.index
         n_1 = None
-        storage = {0: StorageType.RAM, 1: StorageType.DISK}[storage]
+        storage = _STORAGE_LEVELS[storage]
     elif cp_action in ["Write_Forward", "Discard_Forward"]:
         _, n_0 = action.index
         n_1 = None
-        storage = {0: StorageType.WORK}[0]
+        storage = StorageType.WORK
     elif cp_action in ["Write_Forward_memory",
                        "Discard_Forward_memory"]:
         n_0 = action.index
         n_1 = None
-        storage = {0: StorageType.WORK}[0]
+        storage = StorageType.WORK
     elif cp_action in ["Read_disk", "Write_disk", "Discard_disk"]:
         n_0 = action.index
         n_1 = None
-        storage = 1
-        storage = {1: StorageType.DISK}[storage]
+        storage = StorageType.DISK
     elif cp_action in ["Read_memory", "Write_memory", "Discard_memory"]:
         n_0 = action.index
         n_1 = None
-        storage = 0
-        storage = {0: StorageType.RAM}[storage]
+        storage = StorageType.RAM
     else:
         raise InvalidRevolverAction
     return cp_action, (n_0, n_1, storage)
 
 
-class InvalidForwardStep(IndexError):
-    "The forward step is not correct."
+def _build_soa(schedule):
+    """Convert a sequence of H-Revolve operations to arrays of operation
+    identifiers, step indices and storage identifiers.
+
+    Parameters
+    ----------
+    schedule : iterable
+        The sequence of operations given by a revolver algorithm. Operations
+        are converted as they are iterated over, without first collecting them
+        in a list.
+
+    Returns
+    -------
+    _OperationArrays
+        The operation identifiers, the first step index of each operation, the
+        second step index of each operation (or -1 if the operation has only
+        one step index), and the storage identifiers.
+    """
+
+    convert_action = _convert_action
+    action_id = _ACTION_ID
+    storage_id = _STORAGE_ID
+    schedule = iter(schedule)
+    size = max(operator.length_hint(schedule), 1)
+    action_ids = np.empty(size, dtype=np.int8)
+    n0s = np.empty(size, dtype=np.int64)
+    n1s = np.empty(size, dtype=np.int64)
+    storages = np.empty(size, dtype=np.int8)
+    n_operations = 0
+    for i, operation in enumerate(schedule):
+        if i == size:
+            size *= 2
+            action_ids, n0s, n1s, storages = (
+                np.resize(values, size)
+                for values in (action_ids, n0s, n1s, storages))
+        cp_action, (n_0, n_1, storage) = convert_action(operation)
+        if cp_action not in action_id:
+            raise InvalidRevolverAction
+        action_ids[i] = action_id[cp_action]
+        n0s[i] = n_0
+        n1s[i] = -1 if n_1 is None else n_1
+        storages[i] = storage_id[storage]
+        n_operations = i + 1
+    action_ids, n0s, n1s, storages = (
+        values[:n_operations].copy()
+        for values in (action_ids, n0s, n1s, storages))
+    _validate_operations(action_ids, n0s, n1s)
+    return _OperationArrays(action_ids, n0s, n1s, storages)
+
+
+def _validate_operations(action_ids, n0s, n1s):
+    """Check the step indices of a converted H-Revolve sequence, for those
+    checks which do not depend upon the schedule state.
+
+    Parameters
+    ----------
+    action_ids : ndarray
+        Operation identifiers.
+    n0s : ndarray
+        The first step index of each operation.
+    n1s : ndarray
+        The second step index of each operation, or -1 if the operation has
+        only one step index.
+    """
 
+    forward = action_ids == _FORWARD
+    if np.any(n1s[forward] <= n0s[forward]):
+        raise RuntimeError("Invalid forward indexes.")
+    backward = action_ids == _BACKWARD
+    if np.any(n0s[backward] <= n1s[backward]):
+        raise RuntimeError("Invalid backward indexes.")
+
+    # The operation preceding a forward advancement, with the same
+    # wrap-around as indexing with i - 1
+    w_action_ids = np.roll(action_ids, 1)
+    w_n0s = np.roll(n0s, 1)
+    if np.any(forward & (w_action_ids == _WRITE) & (w_n0s != n0s)):
+        raise InvalidActionIndex
+    if np.any(forward
+              & ((w_action_ids == _WRITE_FORWARD)
+                 | (w_action_ids == _WRITE_FORWARD_MEMORY))
+              & (w_n0s != n1s)):
+        raise InvalidActionIndex
+
+    if np.any(action_ids[:2] == _DISCARD):
+        raise InvalidRevolverAction
 
-class InvalidReverseStep(IndexError):
-    "The reverse step is not correct."
 
+def _discarded(action_ids, n0s, storages):
+    """Determine which forward data write operations are matched by a discard
+    of the same data three operations later.
 
-class InvalidRevolverAction(Exception):
-    "The action is not expected for this iterator."
+    Parameters
+    ----------
+    action_ids : ndarray
+        Operation identifiers.
+    n0s : ndarray
+        The first step index of each operation.
+    storages : ndarray
+        Storage identifiers.
 
+    Returns
+    -------
+    ndarray
+        Boolean array, indicating for each operation whether it is a
+        `Write_Forward` (or `Write_Forward_memory`) operation followed three
+        operations later by the corresponding `Discard_Forward` (or
+        `Discard_Forward_memory`) operation.
+    """
 
-class InvalidActionIndex(IndexError):
-    "The index of the action is not correct."
+    # Look-ahead by three operations, with sentinels past the end of the
+    # sequence
+    m = max(len(action_ids) - 3, 0)
+    d_action_ids = np.full_like(action_ids, -1)
+    d_action_ids[:m] = action_ids[3:]
+    d_n0s = np.full_like(n0s, -1)
+    d_n0s[:m] = n0s[3:]
+    d_storages = np.full_like(storages, _NO_STORAGE)
+    d_storages[:m] = storages[3:]
+
+    return (((action_ids == _WRITE_FORWARD)
+             & (d_action_ids == _DISCARD_FORWARD))
+            | ((action_ids == _WRITE_FORWARD_MEMORY)
+               & (d_action_ids == _DISCARD_FORWARD_MEMORY))) \
+        & (d_n0s == n0s) & (d_storages == storages)
@@ -8,7 +8,8 @@ import warnings
 import functools
 import numpy as np
 from .schedule import CheckpointSchedule, Forward, Reverse, Copy, Move, \
-    EndForward, EndReverse, StepType, StorageType
+    EndForward, EndReverse, StepType, StorageType, InvalidForwardStep, \
+    InvalidActionIndex
 
 __all__ = ["MixedCheckpointSchedule"]
 
@@ -51,6 +52,8 @@ class MixedCheckpointSchedule(CheckpointSchedule):
     DOI: https://doi.org/10.1016/j.jocs.2024.102405
     """
 
+    __slots__ = ("_exhausted", "_snapshots", "_storage")
+
     def __init__(self, max_n, snapshots, *, storage=StorageType.DISK):
         if snapshots < min(1, max_n - 1):
             raise ValueError("Invalid number of snapshots")
@@ -63,6 +66,8 @@ class MixedCheckpointSchedule(CheckpointSchedule):
         self._storage = storage
 
     def _iterator(self):
+        work = StorageType.WORK
+
         snapshot_n = set()
         snapshots = []
 
@@ -99,16 +104,16 @@ class MixedCheckpointSchedule(CheckpointSchedule):
                 if step_type == StepType.FORWARD_REVERSE:
                     if n1 > n0 + 1:
                         self._n = n1 - 1
-                        yield Forward(n0, n1 - 1, False, False, StorageType.WORK)  # noqa: E501
+                        yield Forward(n0, n1 - 1, False, False, work)
                     elif n1 <= n0:
                         raise InvalidForwardStep
                     self._n += 1
-                    yield Forward(n1 - 1, n1, False, True, StorageType.WORK)  # noqa: E501
+                    yield Forward(n1 - 1, n1, False, True, work)
                 elif step_type == StepType.FORWARD:
                     if n1 <= n0:
                         raise InvalidForwardStep
                     self._n = n1
-                    yield Forward(n0, n1, False, False, StorageType.WORK)  # noqa: E501
+                    yield Forward(n0, n1, False, False, work)
                 elif step_type == StepType.WRITE_ADJ_DEPS:
                     if n1 != n0 + 1:
                         raise InvalidForwardStep
@@ -125,7 +130,7 @@ class MixedCheckpointSchedule(CheckpointSchedule):
                         raise InvalidActionIndex
                     self._n = n1
                     if reuse_snapshot:
-                        yield Forward(n0, n1, False, False, StorageType.WORK)
+                        yield Forward(n0, n1, False, False, work)
                     else:
                         yield Forward(n0, n1, True, False, self._storage)
                         if len(snapshots) > self._snapshots - 1:
@@ -178,9 +183,9 @@ class MixedCheckpointSchedule(CheckpointSchedule):
                 # Note that we cannot in general restart the forward here
                 self._n = cp_n + 1
             if cp_delete:
-                yield Move(cp_n, self._storage, StorageType.WORK)
+                yield Move(cp_n, self._storage, work)
             else:
-                yield Copy(cp_n, self._storage, StorageType.WORK)
+                yield Copy(cp_n, self._storage, work)
 
         if len(snapshot_n) > 0 or len(snapshots) > 0:
             raise RuntimeError("Invalid checkpointing state")
@@ -335,19 +340,3 @@ def mixed_steps_tabulation(n, s):
                 if m1 < schedule[n_i, s_i, 2]:
                     schedule[n_i, s_i, :] = (_WRITE_ADJ_DEPS, 1, m1)
     return schedule
-
-
-class InvalidForwardStep(IndexError):
-    "The forward step is not correct."
-
-
-class InvalidReverseStep(IndexError):
-    "The reverse step is not correct."
-
-
-class InvalidRevolverAction(Exception):
-    "The action is not expected for this iterator."
-
-
-class InvalidActionIndex(IndexError):
-    "The index of the action is not correct."
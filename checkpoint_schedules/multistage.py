@@ -179,6 +179,9 @@ class MultistageCheckpointSchedule(CheckpointSchedule):
     1946-1967. doi: 10.1137/080718036
     """
 
+    __slots__ = ("_snapshots_in_ram", "_snapshots_on_disk", "_storage",
+                 "_exhausted", "_trajectory")
+
     def __init__(self, max_n, snapshots_in_ram, snapshots_on_disk, *,
                  trajectory="maximum"):
         super().__init__(max_n=max_n)
@@ -202,6 +205,8 @@ class MultistageCheckpointSchedule(CheckpointSchedule):
         self._trajectory = trajectory
 
     def _iterator(self):
+        work = StorageType.WORK
+
         snapshots = []
 
         def write(n):
@@ -230,7 +235,7 @@ class MultistageCheckpointSchedule(CheckpointSchedule):
 
         # Forward -> reverse
         self._n += 1
-        yield Forward(self._n - 1, self._n, False, True, StorageType.WORK)
+        yield Forward(self._n - 1, self._n, False, True, work)
 
         yield EndForward()
 
@@ -246,10 +251,10 @@ class MultistageCheckpointSchedule(CheckpointSchedule):
             if cp_n == self._max_n - self._r - 1:
                 snapshots.pop()
                 self._n = cp_n
-                yield Move(cp_n, cp_storage, StorageType.WORK)
+                yield Move(cp_n, cp_storage, work)
             else:
                 self._n = cp_n
-                yield Copy(cp_n, cp_storage, StorageType.WORK)
+                yield Copy(cp_n, cp_storage, work)
                 n_snapshots = (self._snapshots_in_ram
                                + self._snapshots_on_disk
                                - len(snapshots) + 1)
@@ -259,7 +264,7 @@ class MultistageCheckpointSchedule(CheckpointSchedule):
                                     trajectory=self._trajectory)
                 assert n1 > n0
                 self._n = n1
-                yield Forward(n0, n1, False, False, StorageType.WORK)
+                yield Forward(n0, n1, False, False, work)
 
                 while self._n < self._max_n - self._r - 1:
                     n_snapshots = (self._snapshots_in_ram
@@ -278,7 +283,7 @@ class MultistageCheckpointSchedule(CheckpointSchedule):
                     raise RuntimeError("Invalid checkpointing state")
 
             self._n += 1
-            yield Forward(self._n - 1, self._n, False, True, StorageType.WORK)  # noqa: E501
+            yield Forward(self._n - 1, self._n, False, True, work)
             self._r += 1
             yield Reverse(self._n, self._n - 1, True)
         if self._r != self._max_n:
@@ -372,7 +377,6 @@ def optimal_steps_binomial(n, s):
     return n + optimal_extra_steps(n, s)
 
 
-@njit
 def n_advance(n, snapshots, *, trajectory="maximum"):
     """Return the number of steps to advance in a Revolve schedule.
 
@@ -395,6 +399,15 @@ def n_advance(n, snapshots, *, trajectory="maximum"):
     Software, 26(1), pp. 19--45, 2000, doi: 10.1145/347837.347846.
     """
 
+    if trajectory not in {"maximum", "revolve"}:
+        raise ValueError(f"Unexpected trajectory: {trajectory!r}")
+    return _n_advance(n, snapshots, trajectory == "maximum")
+
+
+# The trajectory is passed as a boolean, as passing a string to a Numba
+# compiled function adds significant call overhead
+@njit
+def _n_advance(n, snapshots, maximum):
     if n < 1:
         raise ValueError("Require at least one block")
     if snapshots <= 0:
@@ -423,7 +436,7 @@ def n_advance(n, snapshots, *, trajectory="maximum"):
         b_s_tm1 = b_s_t
         b_s_t = (b_s_t * (snapshots + t)) // t
 
-    if trajectory == "maximum":
+    if maximum:
         # Return the maximal step size compatible with Fig. 4 of [1]
         b_sm1_tm2 = (b_s_tm2 * snapshots) // (snapshots + t - 2)
         if n <= b_s_tm1 + b_sm1_tm2:
@@ -436,7 +449,7 @@ def n_advance(n, snapshots, *, trajectory="maximum"):
             return n - b_sm1_tm1 - b_sm2_tm1
         else:
             return b_s_tm1
-    elif trajectory == "revolve":
+    else:
         # [1], equation at the bottom of p. 34
         b_sm1_tm1 = (b_s_tm1 * snapshots) // (snapshots + t - 1)
         b_sm2_tm1 = (b_sm1_tm1 * (snapshots - 1)) // (snapshots + t - 2)
@@ -446,6 +459,3 @@ def n_advance(n, snapshots, *, trajectory="maximum"):
             return n - b_sm1_tm1 - b_sm2_tm1
         else:
             return b_s_tm1
-    else:
-        print(trajectory)
-        raise ValueError("Unexpected trajectory: '{trajectory:s}'")
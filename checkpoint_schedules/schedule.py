@@ -10,8 +10,8 @@ schedules.
 """
 
 from abc import ABC, abstractmethod
-import functools
-from enum import IntEnum, Enum
+from enum import IntEnum
+import numpy as np
 import sys
 
 __all__ = \
@@ -25,10 +25,12 @@ __all__ = \
         "EndReverse",
         "CheckpointSchedule",
         "StorageType",
+        "pack_actions",
+        "unpack_actions",
     ]
 
 
-class StorageType(Enum):
+class StorageType(IntEnum):
     """Storage types.
 
     RAM : Memory.
@@ -44,16 +46,25 @@ class StorageType(Enum):
     The data stored in `RAM` or on `DISK` should not be directly accessed by
     the forward or the adjoint, but should instead be copied or moved to `WORK`
     before usage.
+
+    Storage types are integer enumerations, and their values may be stored
+    in integer arrays.
     """
 
     RAM = 0
     DISK = 1
     WORK = -1
-    NONE = None
+    NONE = -2
 
     def __repr__(self):
         return type(self).__name__ + "." + self.name
 
+    __str__ = __repr__
+
+
+# Storage types, keyed by value
+_STORAGE_TYPE = {storage.value: storage for storage in StorageType}
+
 
 class StepType(IntEnum):
     """Used when generating schedules, particularly when solving a dynamic
@@ -89,21 +100,54 @@ class CheckpointAction:
 
     Attributes
     ----------
-    * args : Any
-        Action parameters.
+    * args : tuple
+        Action parameters, in the order in which they are passed to the
+        constructor.
+
+    Notes
+    -----
+    Derived classes store their parameters as named slots, listed in
+    `__slots__` in constructor argument order. Actions are immutable, and
+    derived class constructors assign the slots using `object.__setattr__`.
+    Derived classes may override `args` to avoid the generic slot lookup.
+    The same order is used for positional patterns in `match` statements,
+    e.g.
+
+    .. code-block:: python
+
+        match cp_action:
+            case Forward(n0, n1, write_ics, write_adj_deps, storage):
+                ...
     """
 
-    def __init__(self, *args):
-        self.args = args
+    __slots__ = ("__weakref__",)
+
+    @property
+    def args(self):
+        return tuple(getattr(self, name) for name in self.__slots__
+                     if name != "__weakref__")
 
     def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.args))})"
 
-        strargs = tuple("sys.maxsize" if arg == sys.maxsize else repr(arg)
-                        for arg in self.args)
-        return f"{type(self).__name__}({', '.join(strargs)})"
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __eq__(self, other):
-        return isinstance(self, other) and self.args == other.args
+        if self is other:
+            return True
+        if not isinstance(other, CheckpointAction):
+            return NotImplemented
+        return type(self) is type(other) and self.args == other.args
+
+    def __hash__(self):
+        return hash((type(self), self.args))
+
+    def __reduce__(self):
+        return (type(self), self.args)
 
 
 class Forward(CheckpointAction):
@@ -146,11 +190,31 @@ class Forward(CheckpointAction):
 
     """
 
+    __slots__ = ("n0", "n1", "write_ics", "write_adj_deps", "storage")
+    __match_args__ = __slots__
+
     def __init__(self, n0, n1, write_ics, write_adj_deps, storage):
-        super().__init__(n0, n1, write_ics, write_adj_deps, storage)
+        assert n1 > n0
+        assert isinstance(storage, StorageType)
+        set_slot = object.__setattr__
+        set_slot(self, "n0", n0)
+        set_slot(self, "n1", n1)
+        set_slot(self, "write_ics", write_ics)
+        set_slot(self, "write_adj_deps", write_adj_deps)
+        set_slot(self, "storage", storage)
+
+    @property
+    def args(self):
+        return (self.n0, self.n1, self.write_ics, self.write_adj_deps,
+                self.storage)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({_repr_step(self.n0)}, "
+                f"{_repr_step(self.n1)}, {self.write_ics!r}, "
+                f"{self.write_adj_deps!r}, {self.storage!r})")
 
     def __iter__(self):
-        yield from range(self.n0, self.n1)
+        return iter(range(self.n0, self.n1))
 
     def __len__(self):
         return self.n1 - self.n0
@@ -158,26 +222,6 @@ class Forward(CheckpointAction):
     def __contains__(self, step):
         return self.n0 <= step < self.n1
 
-    @property
-    def n0(self):
-        return self.args[0]
-
-    @property
-    def n1(self):
-        return self.args[1]
-
-    @property
-    def write_ics(self):
-        return self.args[2]
-
-    @property
-    def write_adj_deps(self):
-        return self.args[3]
-
-    @property
-    def storage(self):
-        return self.args[4]
-
 
 class Reverse(CheckpointAction):
     """Adjoint advancement action.
@@ -206,12 +250,26 @@ class Reverse(CheckpointAction):
           `'True'`).
     """
 
+    __slots__ = ("n1", "n0", "clear_adj_deps")
+    __match_args__ = __slots__
+
     def __init__(self, n1, n0, clear_adj_deps):
+        assert n1 > n0
+        set_slot = object.__setattr__
+        set_slot(self, "n1", n1)
+        set_slot(self, "n0", n0)
+        set_slot(self, "clear_adj_deps", clear_adj_deps)
 
-        super().__init__(n1, n0, clear_adj_deps)
+    @property
+    def args(self):
+        return (self.n1, self.n0, self.clear_adj_deps)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({_repr_step(self.n1)}, "
+                f"{_repr_step(self.n0)}, {self.clear_adj_deps!r})")
 
     def __iter__(self):
-        yield from range(self.n1 - 1, self.n0 - 1, -1)
+        return iter(range(self.n1 - 1, self.n0 - 1, -1))
 
     def __len__(self):
         return self.n1 - self.n0
@@ -219,18 +277,6 @@ class Reverse(CheckpointAction):
     def __contains__(self, step):
         return self.n0 <= step < self.n1
 
-    @property
-    def n0(self):
-        return self.args[1]
-
-    @property
-    def n1(self):
-        return self.args[0]
-
-    @property
-    def clear_adj_deps(self):
-        return self.args[2]
-
 
 class Copy(CheckpointAction):
     """Copy action. Indicates copying of data from one storage type to another.
@@ -275,20 +321,20 @@ class Copy(CheckpointAction):
     :class:`StorageType`
     """
 
-    def __init__(self, n, from_storage, to_storage):
-        super().__init__(n, from_storage, to_storage)
+    __slots__ = ("n", "from_storage", "to_storage")
+    __match_args__ = __slots__
 
-    @property
-    def n(self):
-        return self.args[0]
-
-    @property
-    def from_storage(self):
-        return self.args[1]
+    def __init__(self, n, from_storage, to_storage):
+        assert isinstance(from_storage, StorageType)
+        assert isinstance(to_storage, StorageType)
+        set_slot = object.__setattr__
+        set_slot(self, "n", n)
+        set_slot(self, "from_storage", from_storage)
+        set_slot(self, "to_storage", to_storage)
 
     @property
-    def to_storage(self):
-        return self.args[2]
+    def args(self):
+        return (self.n, self.from_storage, self.to_storage)
 
 
 class Move(CheckpointAction):
@@ -332,37 +378,183 @@ class Move(CheckpointAction):
     :class:`StorageType`
     """
 
+    __slots__ = ("n", "from_storage", "to_storage")
+    __match_args__ = __slots__
+
     def __init__(self, n, from_storage, to_storage):
-        super().__init__(n, from_storage, to_storage)
+        assert isinstance(from_storage, StorageType)
+        assert isinstance(to_storage, StorageType)
+        set_slot = object.__setattr__
+        set_slot(self, "n", n)
+        set_slot(self, "from_storage", from_storage)
+        set_slot(self, "to_storage", to_storage)
 
     @property
-    def n(self):
-        return self.args[0]
+    def args(self):
+        return (self.n, self.from_storage, self.to_storage)
 
-    @property
-    def from_storage(self):
-        return self.args[1]
 
-    @property
-    def to_storage(self):
+class _SingletonAction(CheckpointAction):
+    """Base class for actions without parameters, for which the constructor
+    returns a single shared instance of each derived class.
+    """
+
+    __slots__ = ()
 
-        return self.args[2]
+    def __new__(cls):
+        self = cls.__dict__.get("_instance")
+        if self is None:
+            self = cls._instance = super().__new__(cls)
+        return self
 
 
-class EndForward(CheckpointAction):
+class EndForward(_SingletonAction):
     """Indicates that the forward calculation has concluded.
+
+    Notes
+    -----
+    Instances carry no parameters, and a single shared instance is returned
+    by the constructor.
     """
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
 
-class EndReverse(CheckpointAction):
+class EndReverse(_SingletonAction):
     """Indicates that an adjoint calculation has concluded.
+
+    Notes
+    -----
+    Instances carry no parameters, and a single shared instance is returned
+    by the constructor.
     """
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
+
+
+# Action types in a packed action array, indexed by the "action" field
+_PACKED_ACTION_TYPES = (Forward, Reverse, Copy, Move, EndForward, EndReverse)
+_PACKED_ACTION_ID = {cls: action_id
+                     for action_id, cls in enumerate(_PACKED_ACTION_TYPES)}
+_PACKED_ACTION_DTYPE = np.dtype([("action", np.int8),
+                                 ("n0", np.int64),
+                                 ("n1", np.int64),
+                                 ("flag0", np.bool_),
+                                 ("flag1", np.bool_),
+                                 ("storage0", np.int8),
+                                 ("storage1", np.int8)])
+
+
+def pack_actions(actions):
+    """Pack checkpointing actions into a NumPy structured array.
+
+    Parameters
+    ----------
+    actions : iterable
+        The checkpointing actions.
+
+    Returns
+    -------
+    ndarray
+        A structured array with one element per action, with fields:
+
+        - `action` : The action type -- 0 for :class:`Forward`, 1 for
+          :class:`Reverse`, 2 for :class:`Copy`, 3 for :class:`Move`, 4 for
+          :class:`EndForward`, and 5 for :class:`EndReverse`.
+        - `n0`, `n1` : The step indices of a :class:`Forward` or
+          :class:`Reverse`, or the step `n` of a :class:`Copy` or
+          :class:`Move` in `n0`.
+        - `flag0`, `flag1` : `write_ics` and `write_adj_deps` of a
+          :class:`Forward`, or `clear_adj_deps` of a :class:`Reverse` in
+          `flag0`.
+        - `storage0`, `storage1` : The :class:`StorageType` value of the
+          `storage` of a :class:`Forward`, or the `from_storage` and
+          `to_storage` of a :class:`Copy` or :class:`Move`.
+
+        Unused fields are zero.
+
+    See Also
+    --------
+    :func:`unpack_actions`
+    """
+
+    action_id = _PACKED_ACTION_ID
+    rows = []
+    for cp_action in actions:
+        cls = type(cp_action)
+        if cls not in action_id:
+            raise TypeError(f"Unexpected checkpointing action: {cp_action}")
+        if cls is Forward:
+            rows.append((action_id[cls], cp_action.n0, cp_action.n1,
+                         cp_action.write_ics, cp_action.write_adj_deps,
+                         cp_action.storage, 0))
+        elif cls is Reverse:
+            rows.append((action_id[cls], cp_action.n0, cp_action.n1,
+                         cp_action.clear_adj_deps, False, 0, 0))
+        elif cls in {Copy, Move}:
+            rows.append((action_id[cls], cp_action.n, 0, False, False,
+                         cp_action.from_storage, cp_action.to_storage))
+        else:
+            rows.append((action_id[cls], 0, 0, False, False, 0, 0))
+    return np.array(rows, dtype=_PACKED_ACTION_DTYPE)
+
+
+def unpack_actions(packed):
+    """Unpack checkpointing actions from a NumPy structured array.
+
+    Parameters
+    ----------
+    packed : ndarray
+        Packed actions, as returned by :func:`pack_actions`.
+
+    Returns
+    -------
+    Iterable[CheckpointAction]
+        The checkpointing actions.
+
+    See Also
+    --------
+    :func:`pack_actions`
+    """
+
+    action_types = _PACKED_ACTION_TYPES
+    n_action_types = len(action_types)
+    storage_type = _unpack_storage_type
+    for (action, n0, n1, flag0, flag1,
+         storage0, storage1) in packed.tolist():
+        if not 0 <= action < n_action_types:
+            raise ValueError(f"Unexpected packed action identifier: "
+                             f"{action}")
+        cls = action_types[action]
+        if cls is Forward:
+            yield Forward(n0, n1, flag0, flag1, storage_type(storage0))
+        elif cls is Reverse:
+            yield Reverse(n1, n0, flag0)
+        elif cls in {Copy, Move}:
+            yield cls(n0, storage_type(storage0), storage_type(storage1))
+        else:
+            yield cls()
+
+
+def _unpack_storage_type(storage):
+    """Return the :class:`StorageType` with a given packed value.
+
+    Parameters
+    ----------
+    storage : int
+        The packed storage type value.
+
+    Returns
+    -------
+    StorageType
+        The storage type.
+    """
+
+    try:
+        return _STORAGE_TYPE[storage]
+    except KeyError:
+        raise ValueError(f"Unexpected packed storage type: "
+                         f"{storage}") from None
 
 
 class CheckpointSchedule(ABC):
@@ -396,8 +588,26 @@ class CheckpointSchedule(ABC):
             action(cp_action)
             if isinstance(cp_action, EndReverse):
                 break
+
+    The set of action types is fixed, so where dispatch overhead matters the
+    handlers may instead be looked up directly by type, avoiding the
+    method resolution order walk performed by single-dispatch functions. e.g.
+
+    .. code-block:: python
+
+        handlers = {Forward: action_forward,
+                    Reverse: action_reverse,
+                    # ...
+                    }
+
+        for cp_action in cp_schedule:
+            handlers[type(cp_action)](cp_action)
+            if isinstance(cp_action, EndReverse):
+                break
     """
 
+    __slots__ = ("_n", "_r", "_max_n", "_iter", "_packed", "__weakref__")
+
     def __init__(self, max_n=None):
         if max_n is not None and max_n < 1:
             raise ValueError("max_n must be positive")
@@ -405,25 +615,17 @@ class CheckpointSchedule(ABC):
         self._n = 0
         self._r = 0
         self._max_n = max_n
-
-    def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
-
-        cls_iter = cls._iterator
-
-        @functools.wraps(cls_iter)
-        def _iterator(self):
-            if not hasattr(self, "iter"):
-                self.iter = cls_iter(self)
-            return self.iter
-
-        cls._iterator = _iterator
+        self._iter = None
+        self._packed = None
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return next(self._iterator())
+        cp_iter = self._iter
+        if cp_iter is None:
+            cp_iter = self._iter = self._iterator()
+        return next(cp_iter)
 
     @abstractmethod
     def _iterator(self):
@@ -488,7 +690,7 @@ class CheckpointSchedule(ABC):
         """Whether at least one action has been yielded.
         """
 
-        return hasattr(self, "_iter")
+        return self._iter is not None
 
     def finalize(self, n):
         """Indicate the number of forward steps in the initial forward
@@ -510,3 +712,58 @@ class CheckpointSchedule(ABC):
                 raise RuntimeError("Invalid checkpointing state")
         elif self._n != n or self._max_n != n:
             raise RuntimeError("Invalid checkpointing state")
+
+    def materialize(self):
+        """Advance through the schedule from its current position up to and
+        including the conclusion of the first adjoint calculation, and pack
+        the actions.
+
+        Returns
+        -------
+        ndarray
+            The packed actions, including the final :class:`EndReverse`
+            action. See :func:`pack_actions`.
+
+        Notes
+        -----
+        The number of forward steps must be known. The actions are consumed
+        by the first call. The read-only result is cached, and returned by
+        later calls.
+        """
+
+        if self._packed is not None:
+            return self._packed
+        if self._max_n is None:
+            raise RuntimeError("max_n must be known")
+
+        def cp_actions():
+            for cp_action in self:
+                yield cp_action
+                if isinstance(cp_action, EndReverse):
+                    break
+
+        packed = pack_actions(cp_actions())
+        packed.setflags(write=False)
+        self._packed = packed
+        return packed
+
+
+def _repr_step(n):
+    # sys.maxsize is used to indicate an unknown number of steps
+    return "sys.maxsize" if n == sys.maxsize else repr(n)
+
+
+class InvalidForwardStep(IndexError):
+    "The forward step is not correct."
+
+
+class InvalidReverseStep(IndexError):
+    "The reverse step is not correct."
+
+
+class InvalidRevolverAction(Exception):
+    "The action is not expected for this iterator."
+
+
+class InvalidActionIndex(IndexError):
+    "The index of the action is not correct."
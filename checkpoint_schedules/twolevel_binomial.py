@@ -48,6 +48,9 @@ class TwoLevelCheckpointSchedule(CheckpointSchedule):
     Online, unlimited adjoint calculations permitted.
     """
 
+    __slots__ = ("_period", "_binomial_snapshots", "_binomial_storage",
+                 "_trajectory")
+
     def __init__(self, period, binomial_snapshots, *,
                  binomial_storage=StorageType.DISK,
                  binomial_trajectory="maximum"):
@@ -63,6 +66,9 @@ class TwoLevelCheckpointSchedule(CheckpointSchedule):
         self._trajectory = binomial_trajectory
 
     def _iterator(self):
+        work = StorageType.WORK
+        disk = StorageType.DISK
+
         # Forward
 
         while self._max_n is None:
@@ -72,7 +78,7 @@ class TwoLevelCheckpointSchedule(CheckpointSchedule):
             n0 = self._n
             n1 = n0 + self._period
             self._n = n1
-            yield Forward(n0, n1, True, False, StorageType.DISK)
+            yield Forward(n0, n1, True, False, disk)
 
         yield EndForward()
 
@@ -95,15 +101,15 @@ class TwoLevelCheckpointSchedule(CheckpointSchedule):
                         snapshots.pop()
                         self._n = cp_n
                         if cp_n == n0s:
-                            yield Copy(cp_n, StorageType.DISK, StorageType.WORK)  # noqa: E501
+                            yield Copy(cp_n, disk, work)
                         else:
-                            yield Move(cp_n, self._binomial_storage, StorageType.WORK)  # noqa: E501
+                            yield Move(cp_n, self._binomial_storage, work)
                     else:
                         self._n = cp_n
                         if cp_n == n0s:
-                            yield Copy(cp_n, StorageType.DISK, StorageType.WORK)  # noqa: E501
+                            yield Copy(cp_n, disk, work)
                         else:
-                            yield Copy(cp_n, self._binomial_storage, StorageType.WORK)  # noqa: E501
+                            yield Copy(cp_n, self._binomial_storage, work)
 
                         n_snapshots = (self._binomial_snapshots + 1
                                        - len(snapshots) + 1)
@@ -113,7 +119,7 @@ class TwoLevelCheckpointSchedule(CheckpointSchedule):
                                             trajectory=self._trajectory)
                         assert n1 > n0
                         self._n = n1
-                        yield Forward(n0, n1, False, False, StorageType.WORK)  # noqa: E501
+                        yield Forward(n0, n1, False, False, work)
 
                         while self._n < self._max_n - self._r - 1:
                             n_snapshots = (self._binomial_snapshots + 1
@@ -135,7 +141,7 @@ class TwoLevelCheckpointSchedule(CheckpointSchedule):
                             raise RuntimeError("Invalid checkpointing state")
 
                     self._n += 1
-                    yield Forward(self._n - 1, self._n, False, True, StorageType.WORK)  # noqa: E501
+                    yield Forward(self._n - 1, self._n, False, True, work)
 
                     self._r += 1
                     yield Reverse(self._n, self._n - 1, True)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from checkpoint_schedules.hrevolve import (
+    RevolveCheckpointSchedule, _ACTION_ID, _STORAGE_ID, _build_soa,
+    _discarded)
+from checkpoint_schedules.hrevolve_sequences import revolve
+from checkpoint_schedules.hrevolve_sequences.basic_functions import Operation
+from checkpoint_schedules.schedule import (
+    InvalidActionIndex, InvalidRevolverAction, StorageType)
+
+
+def operations(*args):
+    """Return a sequence of H-Revolve operations.
+
+    Parameters
+    ----------
+    args : tuple[tuple[str, object]]
+        The type and index of each operation.
+    """
+
+    return [Operation(operation_type, operation_index, {})
+            for operation_type, operation_index in args]
+
+
+def test_write_index():
+    # The forward restart data is written at the wrong step
+    schedule = operations(("Write_memory", 1), ("Forward", [0, 3]))
+    with pytest.raises(InvalidActionIndex):
+        _build_soa(schedule)
+
+
+def test_forward_index():
+    schedule = operations(("Write_memory", 0), ("Forward", [3, 0]))
+    with pytest.raises(RuntimeError, match="Invalid forward indexes."):
+        _build_soa(schedule)
+
+
+@pytest.mark.parametrize("i", [0, 1])
+def test_early_discard(i):
+    schedule = operations(("Write_memory", 0), ("Forward", [0, 1]))
+    schedule.insert(i, Operation("Discard_memory", 0, {}))
+    with pytest.raises(InvalidRevolverAction):
+        _build_soa(schedule)
+
+
+def test_unexpected_operation():
+    schedule = operations(("Write_memory", 0), ("Forward", [0, 1]),
+                          ("Discard_disk", 0))
+    with pytest.raises(InvalidRevolverAction):
+        _build_soa(schedule)
+
+
+def test_too_many_snapshots():
+    # Two forward restart checkpoints, both loaded again before the end
+    schedule = operations(("Write_memory", 0), ("Forward", [0, 1]),
+                          ("Write_memory", 1), ("Forward", [1, 2]),
+                          ("Write_Forward_memory", 3), ("Forward", [2, 3]),
+                          ("Backward", [3, 2]),
+                          ("Discard_Forward_memory", 3),
+                          ("Read_memory", 1),
+                          ("Write_Forward_memory", 2), ("Forward", [1, 2]),
+                          ("Backward", [2, 1]),
+                          ("Discard_Forward_memory", 2),
+                          ("Discard_memory", 1),
+                          ("Read_memory", 0),
+                          ("Write_Forward_memory", 1), ("Forward", [0, 1]),
+                          ("Backward", [1, 0]),
+                          ("Discard_Forward_memory", 1),
+                          ("Discard_memory", 0))
+    cp_schedule = RevolveCheckpointSchedule(3, 2, 0, schedule)
+    assert len(list(cp_schedule)) == 12
+
+    # Storage for only one forward restart checkpoint
+    cp_schedule = RevolveCheckpointSchedule(3, 1, 0, schedule)
+    with pytest.raises(RuntimeError, match="Unexpected snapshot number."):
+        list(cp_schedule)
+
+
+def test_discarded():
+    schedule = _build_soa(revolve(4, 2, 2, 2, 1, 1))
+    discarded = _discarded(schedule.action_ids, schedule.n0s,
+                           schedule.storages)
+    assert discarded.shape == schedule.action_ids.shape
+    # Each adjoint dependency write is followed three operations later by
+    # the corresponding discard
+    assert (discarded
+            == (schedule.action_ids == _ACTION_ID["Write_Forward_memory"])).all()  # noqa: E501
+
+    # A write within three operations of the end of the sequence does not
+    # look past the end
+    work = _STORAGE_ID[StorageType.WORK]
+    for n_operations in range(4):
+        discarded = _discarded(
+            np.full(n_operations, _ACTION_ID["Write_Forward_memory"],
+                    dtype=np.int8),
+            np.zeros(n_operations, dtype=np.int64),
+            np.full(n_operations, work, dtype=np.int8))
+        assert not discarded.any()
+
+
+def test_undiscarded_write():
+    # The adjoint dependency data is not discarded after use
+    schedule = operations(("Write_memory", 0), ("Forward", [0, 1]),
+                          ("Write_Forward_memory", 2), ("Forward", [1, 2]))
+    cp_schedule = RevolveCheckpointSchedule(2, 1, 0, schedule)
+    with pytest.raises(InvalidActionIndex):
+        list(cp_schedule)
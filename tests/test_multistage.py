@@ -6,7 +6,7 @@ import pytest
 from checkpoint_schedules import (
     MultistageCheckpointSchedule, Copy, Move, Forward, Reverse, EndForward,
     EndReverse, StorageType)
-from checkpoint_schedules.multistage import optimal_steps_binomial
+from checkpoint_schedules.multistage import n_advance, optimal_steps_binomial
 
 
 @pytest.mark.parametrize("trajectory", ["revolve",
@@ -219,3 +219,10 @@ def test_multistage(trajectory, n, S):
             pass
         except Exception:
             raise RuntimeError("Iterator not exhausted")
+
+
+@pytest.mark.parametrize("trajectory", ["minimum", None])
+def test_n_advance_trajectory(trajectory):
+    assert n_advance(5, 2, trajectory="revolve") > 0
+    with pytest.raises(ValueError, match="Unexpected trajectory"):
+        n_advance(5, 2, trajectory=trajectory)
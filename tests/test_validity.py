@@ -18,14 +18,19 @@
 # along with tlm_adjoint.  If not, see <https://www.gnu.org/licenses/>.
 
 import functools
+import pickle
 import pytest
+import weakref
 from checkpoint_schedules.schedule import (
-    Forward, Reverse, Copy, Move, EndForward, EndReverse, StorageType)
+    Forward, Reverse, Copy, Move, EndForward, EndReverse, StorageType,
+    pack_actions, unpack_actions)
 from checkpoint_schedules import (
     HRevolve, DiskRevolve, PeriodicDiskRevolve, Revolve,
     MultistageCheckpointSchedule, TwoLevelCheckpointSchedule,
     MixedCheckpointSchedule, SingleDiskStorageSchedule,
     SingleMemoryStorageSchedule)
+from checkpoint_schedules.hrevolve import RevolveCheckpointSchedule
+from checkpoint_schedules.hrevolve_sequences import revolve as revolve_sequence
 
 
 def h_revolve(n, s):
@@ -334,3 +339,126 @@ def test_validity(schedule, n, S):
 
             if isinstance(cp_action, EndReverse):
                 break
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [
+     h_revolve,
+     disk_revolve,
+     periodic_disk,
+     revolve
+     ]
+     )
+@pytest.mark.parametrize("n, s", [(1, 1), (2, 1), (10, 3), (23, 7)])
+def test_revolve_len(schedule, n, s):
+    cp_schedule, _, _ = schedule(n, s)
+    if cp_schedule is None:
+        pytest.skip("Incompatible with schedule type")
+    n_actions = len(cp_schedule)
+    # The total length, unchanged by iteration
+    next(cp_schedule)
+    assert len(cp_schedule) == n_actions
+    assert n_actions == 1 + len(tuple(cp_schedule))
+
+
+def test_revolve_operations():
+    cp_schedule = RevolveCheckpointSchedule(
+        10, 3, 0, list(revolve_sequence(9, 3, 2, 2, 1, 1)))
+    assert list(cp_schedule) == list(Revolve(10, 3))
+
+
+def test_action_eq():
+    assert Forward(0, 2, True, False, StorageType.RAM) \
+        == Forward(0, 2, True, False, StorageType.RAM)
+    assert Forward(0, 2, True, False, StorageType.RAM) \
+        != Forward(0, 2, True, False, StorageType.DISK)
+    assert Copy(1, StorageType.RAM, StorageType.WORK) \
+        != Move(1, StorageType.RAM, StorageType.WORK)
+    assert EndForward() == EndForward()
+    assert EndForward() != EndReverse()
+    assert Reverse(2, 1, True) != (2, 1, True)
+    assert len({Reverse(2, 1, True), Reverse(2, 1, True)}) == 1
+
+
+def test_action_immutable():
+    cp_action = Forward(0, 2, True, False, StorageType.RAM)
+    with pytest.raises(AttributeError):
+        cp_action.n1 = 1
+    with pytest.raises(AttributeError):
+        del cp_action.n1
+    assert cp_action.n1 == 2
+    assert weakref.ref(cp_action)() is cp_action
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [h_revolve,
+     revolve,
+     multistage,
+     twolevel_binomial,
+     mixed])
+def test_schedule_weakref(schedule):
+    cp_schedule, _, _ = schedule(10, 3)
+    assert weakref.ref(cp_schedule)() is cp_schedule
+
+
+def test_is_running():
+    cp_schedule = MultistageCheckpointSchedule(3, 1, 0)
+    assert not cp_schedule.is_running
+    next(cp_schedule)
+    assert cp_schedule.is_running
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [h_revolve,
+     revolve,
+     multistage,
+     mixed])
+def test_pack_actions(schedule):
+    cp_schedule, _, _ = schedule(10, 3)
+    cp_actions = []
+    for cp_action in cp_schedule:
+        cp_actions.append(cp_action)
+        if isinstance(cp_action, EndReverse):
+            break
+    packed = pack_actions(cp_actions)
+    assert packed.shape == (len(cp_actions),)
+    assert list(unpack_actions(packed)) == cp_actions
+
+    cp_schedule, _, _ = schedule(10, 3)
+    assert (cp_schedule.materialize() == packed).all()
+    # The packed actions are cached
+    assert cp_schedule.materialize() is cp_schedule.materialize()
+
+    # Packing starts from the current position
+    cp_schedule, _, _ = schedule(10, 3)
+    next(cp_schedule)
+    assert (cp_schedule.materialize() == packed[1:]).all()
+
+
+@pytest.mark.parametrize("action", [-1, 6])
+def test_unpack_invalid_action(action):
+    packed = pack_actions([EndForward()])
+    packed["action"] = action
+    with pytest.raises(ValueError):
+        list(unpack_actions(packed))
+
+
+@pytest.mark.parametrize("field", ["storage0", "storage1"])
+def test_unpack_invalid_storage(field):
+    packed = pack_actions([Copy(1, StorageType.RAM, StorageType.WORK)])
+    packed[field] = 7
+    with pytest.raises(ValueError):
+        list(unpack_actions(packed))
+
+
+def test_action_pickle():
+    cp_actions = [Forward(0, 2, True, False, StorageType.RAM),
+                  Reverse(2, 1, True),
+                  Copy(1, StorageType.DISK, StorageType.WORK),
+                  Move(1, StorageType.RAM, StorageType.WORK),
+                  EndForward(), EndReverse()]
+    assert pickle.loads(pickle.dumps(cp_actions)) == cp_actions
+    assert pickle.loads(pickle.dumps(EndReverse())) is EndReverse()